@@ -239,7 +239,7 @@ class Domain:
             return a
 
         def merge_lists(l1: List[Any], l2: List[Any]) -> List[Any]:
-            return sorted(list(set(l1 + l2)))
+            return sorted(set(l1).union(l2))
 
         def merge_lists_of_dicts(
             dict_list1: List[Dict],
@@ -311,14 +311,22 @@ class StoryGraph:
             for source, target in self.cyclic_edge_ids
         ]
 
-    def merge(self, other: Optional["StoryGraph"]) -> "StoryGraph":
-        if not other:
+    def merge(self, *others: Optional["StoryGraph"]) -> "StoryGraph":
+        """Return a graph containing the steps of this graph and all others.
+
+        The merged graph is built only once, so merging many graphs does not
+        order the steps of every intermediate result."""
+
+        others = [other for other in others if other]
+        if not others:
             return self
 
-        steps = self.story_steps.copy() + other.story_steps
-        story_end_checkpoints = self.story_end_checkpoints.copy().update(
-            other.story_end_checkpoints
-        )
+        steps = self.story_steps.copy()
+        story_end_checkpoints = self.story_end_checkpoints.copy()
+        for other in others:
+            steps.extend(other.story_steps)
+            story_end_checkpoints.update(other.story_end_checkpoints)
+
         return StoryGraph(steps, story_end_checkpoints)
 
     @staticmethod
@@ -1,15 +1,16 @@
 import asyncio
-from functools import reduce
-from typing import Text, Optional, List, Dict
+from typing import Text, Optional, List, Dict, TYPE_CHECKING
 import logging
 
 from rasa.core.domain import Domain
-from rasa.core.interpreter import RegexInterpreter, NaturalLanguageInterpreter
 from rasa.core.training.structures import StoryGraph
 from rasa.nlu.training_data import TrainingData
 import rasa.utils.io as io_utils
 import rasa.utils.common as common_utils
 
+if TYPE_CHECKING:
+    from rasa.core.interpreter import NaturalLanguageInterpreter
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,7 +27,7 @@ class TrainingDataImporter:
 
     async def get_stories(
         self,
-        interpreter: "NaturalLanguageInterpreter" = RegexInterpreter(),
+        interpreter: Optional["NaturalLanguageInterpreter"] = None,
         template_variables: Optional[Dict] = None,
         use_e2e: bool = False,
         exclusion_percentage: Optional[int] = None,
@@ -35,7 +36,8 @@ class TrainingDataImporter:
 
         Args:
             interpreter: Interpreter that should be used to parse end to
-                         end learning annotations.
+                         end learning annotations. Defaults to a
+                         ``RegexInterpreter``.
             template_variables: Values of templates that should be replaced while
                                 reading the story files.
             use_e2e: Specifies whether to parse end to end learning annotations.
@@ -151,12 +153,14 @@ class TrainingDataImporter:
         from rasa.importers.multi_project import MultiProjectImporter
         from rasa.importers.rasa import RasaFileImporter
 
-        module_path = importer_config.pop("name", None)
-        if module_path == RasaFileImporter.__name__:
-            importer_class = RasaFileImporter
-        elif module_path == MultiProjectImporter.__name__:
-            importer_class = MultiProjectImporter
-        else:
+        known_importers = {
+            RasaFileImporter.__name__: RasaFileImporter,
+            MultiProjectImporter.__name__: MultiProjectImporter,
+        }
+
+        module_path = importer_config.get("name")
+        importer_class = known_importers.get(module_path)
+        if importer_class is None:
             try:
                 importer_class = common_utils.class_from_module_path(module_path)
             except (AttributeError, ImportError):
@@ -164,7 +168,7 @@ class TrainingDataImporter:
                 return None
 
         constructor_arguments = common_utils.minimal_kwargs(
-            importer_config, importer_class
+            importer_config, importer_class, excluded_keys=["name"]
         )
         return importer_class(
             config_path, domain_path, training_data_paths, **constructor_arguments
@@ -182,7 +186,7 @@ class NluDataImporter(TrainingDataImporter):
 
     async def get_stories(
         self,
-        interpreter: "NaturalLanguageInterpreter" = RegexInterpreter(),
+        interpreter: Optional["NaturalLanguageInterpreter"] = None,
         template_variables: Optional[Dict] = None,
         use_e2e: bool = False,
         exclusion_percentage: Optional[int] = None,
@@ -207,7 +211,7 @@ class CoreDataImporter(TrainingDataImporter):
 
     async def get_stories(
         self,
-        interpreter: "NaturalLanguageInterpreter" = RegexInterpreter(),
+        interpreter: Optional["NaturalLanguageInterpreter"] = None,
         template_variables: Optional[Dict] = None,
         use_e2e: bool = False,
         exclusion_percentage: Optional[int] = None,
@@ -231,26 +235,65 @@ class CombinedDataImporter(TrainingDataImporter):
     def __init__(self, importers: List[TrainingDataImporter]):
         self._importers = importers
 
+    @common_utils.lazy_async_method
     async def get_config(self) -> Dict:
         configs = [importer.get_config() for importer in self._importers]
         configs = await asyncio.gather(*configs)
 
-        return reduce(lambda merged, other: {**merged, **(other or {})}, configs, {})
+        merged_config = {}
+        for config in configs:
+            if config:
+                merged_config.update(config)
+
+        return merged_config
 
     async def get_domain(self) -> Domain:
         domains = [importer.get_domain() for importer in self._importers]
         domains = await asyncio.gather(*domains)
 
-        return reduce(
-            lambda merged, other: merged.merge(other), domains, Domain.empty()
-        )
+        merged_domain = Domain.empty()
+        for domain in domains:
+            merged_domain = merged_domain.merge(domain)
+
+        return merged_domain
 
     async def get_stories(
         self,
-        interpreter: "NaturalLanguageInterpreter" = RegexInterpreter(),
+        interpreter: Optional["NaturalLanguageInterpreter"] = None,
+        template_variables: Optional[Dict] = None,
+        use_e2e: bool = False,
+        exclusion_percentage: Optional[int] = None,
+    ) -> StoryGraph:
+        if interpreter:
+            # interpreters are cached by identity, so caching the stories for them
+            # would keep a story graph alive for every interpreter instance
+            return await self._get_stories(
+                interpreter, template_variables, use_e2e, exclusion_percentage
+            )
+
+        return await self._get_stories_with_default_interpreter(
+            template_variables, use_e2e, exclusion_percentage
+        )
+
+    @common_utils.lazy_async_method
+    async def _get_stories_with_default_interpreter(
+        self,
         template_variables: Optional[Dict] = None,
         use_e2e: bool = False,
         exclusion_percentage: Optional[int] = None,
+    ) -> StoryGraph:
+        from rasa.core.interpreter import RegexInterpreter
+
+        return await self._get_stories(
+            RegexInterpreter(), template_variables, use_e2e, exclusion_percentage
+        )
+
+    async def _get_stories(
+        self,
+        interpreter: "NaturalLanguageInterpreter",
+        template_variables: Optional[Dict],
+        use_e2e: bool,
+        exclusion_percentage: Optional[int],
     ) -> StoryGraph:
         stories = [
             importer.get_stories(
@@ -260,14 +303,11 @@ class CombinedDataImporter(TrainingDataImporter):
         ]
         stories = await asyncio.gather(*stories)
 
-        return reduce(
-            lambda merged, other: merged.merge(other), stories, StoryGraph([])
-        )
+        return StoryGraph([]).merge(*stories)
 
+    @common_utils.lazy_async_method
     async def get_nlu_data(self, language: Optional[Text] = "en") -> TrainingData:
         nlu_data = [importer.get_nlu_data(language) for importer in self._importers]
         nlu_data = await asyncio.gather(*nlu_data)
 
-        return reduce(
-            lambda merged, other: merged.merge(other), nlu_data, TrainingData()
-        )
+        return TrainingData().merge(*nlu_data)
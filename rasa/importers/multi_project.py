@@ -1,18 +1,19 @@
 import logging
-from functools import reduce
-from typing import Text, Set, Dict, Optional, List, Union, Any
+from typing import Text, Set, Dict, Optional, List, Union, Any, TYPE_CHECKING
 import os
 
 from rasa import data
 import rasa.utils.io as io_utils
 from rasa.core.domain import Domain
-from rasa.core.interpreter import RegexInterpreter, NaturalLanguageInterpreter
 from rasa.importers.importer import TrainingDataImporter
 from rasa.importers import utils
 from rasa.nlu.training_data import TrainingData
 from rasa.core.training.structures import StoryGraph
 from rasa.utils.common import raise_warning, mark_as_experimental_feature
 
+if TYPE_CHECKING:
+    from rasa.core.interpreter import NaturalLanguageInterpreter
+
 logger = logging.getLogger(__name__)
 
 
@@ -166,14 +167,15 @@ class MultiProjectImporter(TrainingDataImporter):
         self._imports.append(path)
 
     async def get_domain(self) -> Domain:
-        domains = [Domain.load(path) for path in self._domain_paths]
-        return reduce(
-            lambda merged, other: merged.merge(other), domains, Domain.empty()
-        )
+        domain = Domain.empty()
+        for path in self._domain_paths:
+            domain = domain.merge(Domain.load(path))
+
+        return domain
 
     async def get_stories(
         self,
-        interpreter: "NaturalLanguageInterpreter" = RegexInterpreter(),
+        interpreter: Optional["NaturalLanguageInterpreter"] = None,
         template_variables: Optional[Dict] = None,
         use_e2e: bool = False,
         exclusion_percentage: Optional[int] = None,
@@ -1,15 +1,17 @@
 import logging
-from typing import Dict, List, Optional, Text, Union
+from typing import Dict, List, Optional, Text, Union, TYPE_CHECKING
 
 from rasa import data
 from rasa.core.domain import Domain, InvalidDomain
-from rasa.core.interpreter import NaturalLanguageInterpreter, RegexInterpreter
 from rasa.core.training.structures import StoryGraph
 from rasa.importers import utils, autoconfig
 from rasa.importers.importer import TrainingDataImporter
 from rasa.nlu.training_data import TrainingData
 from rasa.utils.common import raise_warning
 
+if TYPE_CHECKING:
+    from rasa.core.interpreter import NaturalLanguageInterpreter
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,7 +38,7 @@ class RasaFileImporter(TrainingDataImporter):
 
     async def get_stories(
         self,
-        interpreter: "NaturalLanguageInterpreter" = RegexInterpreter(),
+        interpreter: Optional["NaturalLanguageInterpreter"] = None,
         template_variables: Optional[Dict] = None,
         use_e2e: bool = False,
         exclusion_percentage: Optional[int] = None,
@@ -18,7 +18,7 @@ def training_data_from_paths(paths: Iterable[Text], language: Text) -> TrainingD
 async def story_graph_from_paths(
     files: List[Text],
     domain: Domain,
-    interpreter: NaturalLanguageInterpreter = RegexInterpreter(),
+    interpreter: Optional[NaturalLanguageInterpreter] = None,
     template_variables: Optional[Dict] = None,
     use_e2e: bool = False,
     exclusion_percentage: Optional[int] = None,
@@ -26,6 +26,8 @@ async def story_graph_from_paths(
 
     from rasa.core.training import loading
 
+    if not interpreter:
+        interpreter = RegexInterpreter()
     story_steps = await loading.load_data_from_files(
         files, domain, interpreter, template_variables, use_e2e, exclusion_percentage
     )
@@ -28,6 +28,8 @@ from rasa.nlu.constants import (
 
 logger = logging.getLogger(__name__)
 
+NUMBER_PATTERN = re.compile(r"\b[0-9]+\b")
+
 
 class CountVectorsFeaturizer(SparseFeaturizer):
     """Creates a sequence of token counts features based on sklearn's `CountVectorizer`.
@@ -226,14 +228,12 @@ class CountVectorsFeaturizer(SparseFeaturizer):
             # Don't do any processing for intent attribute. Treat them as whole labels
             return tokens
 
-        # replace all digits with NUMBER token
-        tokens = [re.sub(r"\b[0-9]+\b", "__NUMBER__", text) for text in tokens]
-
+        # replace all digits with NUMBER token and
         # convert to lowercase if necessary
         if self.lowercase:
-            tokens = [text.lower() for text in tokens]
+            return [NUMBER_PATTERN.sub("__NUMBER__", text).lower() for text in tokens]
 
-        return tokens
+        return [NUMBER_PATTERN.sub("__NUMBER__", text) for text in tokens]
 
     def _replace_with_oov_token(
         self, tokens: List[Text], attribute: Text
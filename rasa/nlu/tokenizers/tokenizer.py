@@ -12,6 +12,8 @@ logger = logging.getLogger(__name__)
 
 
 class Token(object):
+    __slots__ = ("text", "start", "end", "data", "lemma")
+
     def __init__(
         self,
         text: Text,
@@ -85,14 +87,18 @@ class Tokenizer(Component):
     ) -> None:
         """Tokenize all training data."""
 
+        attributes = [
+            (attribute, TOKENS_NAMES[attribute]) for attribute in MESSAGE_ATTRIBUTES
+        ]
+
         for example in training_data.training_examples:
-            for attribute in MESSAGE_ATTRIBUTES:
+            for attribute, tokens_name in attributes:
                 if example.get(attribute) is not None:
                     if attribute == INTENT:
                         tokens = self._split_intent(example)
                     else:
                         tokens = self.tokenize(example, attribute)
-                    example.set(TOKENS_NAMES[attribute], tokens)
+                    example.set(tokens_name, tokens)
 
     def process(self, message: Message, **kwargs: Any) -> None:
         """Tokenize the incoming message."""
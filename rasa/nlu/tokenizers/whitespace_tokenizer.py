@@ -8,6 +8,21 @@ from rasa.nlu.tokenizers.tokenizer import Token, Tokenizer
 from rasa.nlu.training_data import Message
 import rasa.utils.common as common_utils
 
+# we need to use regex instead of re, because of
+# https://stackoverflow.com/questions/12746458/python-unicode-regular-expression-matching-failing-with-some-unicode-characters
+# remove 'not a word character' if
+NON_WORD_PATTERN = regex.compile(
+    # there is a space or an end of a string after it
+    r"[^\w#@&]+(?=\s|$)|"
+    # there is a space or beginning of a string before it
+    # not followed by a number
+    r"(\s|^)[^\w#@&]+(?=[^0-9\s])|"
+    # not in between numbers and not . or @ or & or - or #
+    # e.g. 10'000.00 or blabla@gmail.com
+    # and not url characters
+    r"(?<=[^0-9\s])[^\w._~:/?#\[\]()@!$&*+,;=-]+(?=[^0-9\s])"
+)
+
 
 class WhitespaceTokenizer(Tokenizer):
 
@@ -65,26 +80,8 @@ class WhitespaceTokenizer(Tokenizer):
     def tokenize(self, message: Message, attribute: Text) -> List[Token]:
         text = message.get(attribute)
 
-        # we need to use regex instead of re, because of
-        # https://stackoverflow.com/questions/12746458/python-unicode-regular-expression-matching-failing-with-some-unicode-characters
-
-        # remove 'not a word character' if
-        words = regex.sub(
-            # there is a space or an end of a string after it
-            r"[^\w#@&]+(?=\s|$)|"
-            # there is a space or beginning of a string before it
-            # not followed by a number
-            r"(\s|^)[^\w#@&]+(?=[^0-9\s])|"
-            # not in between numbers and not . or @ or & or - or #
-            # e.g. 10'000.00 or blabla@gmail.com
-            # and not url characters
-            r"(?<=[^0-9\s])[^\w._~:/?#\[\]()@!$&*+,;=-]+(?=[^0-9\s])",
-            " ",
-            text,
-        ).split()
-
-        words = [self.remove_emoji(w) for w in words]
-        words = [w for w in words if w]
+        words = NON_WORD_PATTERN.sub(" ", text).split()
+        words = [w for w in words if self.remove_emoji(w)]
 
         # if we removed everything like smiles `:)`, use the whole text as 1 token
         if not words:
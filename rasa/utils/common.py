@@ -1,3 +1,6 @@
+import asyncio
+import functools
+import inspect
 import logging
 import os
 import shutil
@@ -335,6 +338,50 @@ def lazy_property(function: Callable) -> Any:
     return _lazyprop
 
 
+def lazy_async_method(function: Callable) -> Callable:
+    """Allows to avoid awaiting a coroutine method over and over.
+
+    The coroutine is scheduled once per instance and set of argument values
+    (including defaults). All succeeding (and concurrent) calls await the same
+    future. Calls which raise are not cached, so that they are retried on the next
+    call. Calls with unhashable arguments are never cached."""
+
+    attr_name = "_lazy_" + function.__name__
+    signature = inspect.signature(function)
+
+    @functools.wraps(function)
+    async def _lazy_method(self, *args: Any, **kwargs: Any) -> Any:
+        cache = self.__dict__.setdefault(attr_name, {})
+
+        arguments = signature.bind(self, *args, **kwargs)
+        arguments.apply_defaults()
+        # skip `self`
+        key = tuple(arguments.arguments.items())[1:]
+        try:
+            hash(key)
+        except TypeError:
+            return await function(self, *args, **kwargs)
+
+        future = cache.get(key)
+        if future is None:
+            future = asyncio.ensure_future(function(self, *args, **kwargs))
+            cache[key] = future
+
+        try:
+            # cancelling one caller must not cancel the load for the other callers
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if future.cancelled() and cache.get(key) is future:
+                del cache[key]
+            raise
+        except Exception:
+            if cache.get(key) is future:
+                del cache[key]
+            raise
+
+    return _lazy_method
+
+
 def raise_warning(
     message: Text,
     category: Optional[Type[Warning]] = None,
@@ -1,4 +1,4 @@
-from rasa.core.training.structures import StoryGraph
+from rasa.core.training.structures import StoryGraph, StoryStep
 
 
 def check_graph_is_sorted(g, sorted_nodes, removed_edges):
@@ -45,3 +45,18 @@ def test_node_ordering_with_cycle():
 
 def test_is_empty():
     assert StoryGraph([]).is_empty()
+
+
+def test_merge_multiple_graphs():
+    steps = [StoryStep(block_name=name) for name in ["a", "b", "c"]]
+    graphs = [
+        StoryGraph([steps[0]], {"end_a": "a"}),
+        None,
+        StoryGraph([steps[1]]),
+        StoryGraph([steps[2]], {"end_c": "c"}),
+    ]
+
+    merged = StoryGraph([]).merge(*graphs)
+
+    assert merged.story_steps == steps
+    assert merged.story_end_checkpoints == {"end_a": "a", "end_c": "c"}
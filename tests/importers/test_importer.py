@@ -1,9 +1,14 @@
+import asyncio
+import copy
 import os
 from pathlib import Path
-from typing import Text, Dict, Type, List
+from typing import Text, Dict, Type, List, Optional
 
 import pytest
 from rasa.constants import DEFAULT_CONFIG_PATH, DEFAULT_DOMAIN_PATH, DEFAULT_DATA_PATH
+from rasa.core.interpreter import NaturalLanguageInterpreter, RegexInterpreter
+from rasa.core.slots import UnfeaturizedSlot
+from rasa.core.training.structures import StoryGraph
 from rasa.importers.importer import (
     CombinedDataImporter,
     TrainingDataImporter,
@@ -56,6 +61,73 @@ async def test_combined_file_importer_with_single_importer(project: Text):
     assert actual_stories.as_story_string() == expected_stories.as_story_string()
 
 
+async def test_combined_file_importer_returns_fresh_domain(project: Text):
+    config_path = os.path.join(project, DEFAULT_CONFIG_PATH)
+    domain_path = os.path.join(project, DEFAULT_DOMAIN_PATH)
+    default_data_path = os.path.join(project, DEFAULT_DATA_PATH)
+
+    importer = RasaFileImporter(config_path, domain_path, [default_data_path])
+    combined = CombinedDataImporter([importer])
+
+    # e.g. the `Agent` adds slots to the domain it is given
+    domain = await combined.get_domain()
+    domain.slots.append(UnfeaturizedSlot("added_slot"))
+
+    domain = await combined.get_domain()
+    assert "added_slot" not in [slot.name for slot in domain.slots]
+
+
+async def test_combined_file_importer_caches_results():
+    class CountingImporter(TrainingDataImporter):
+        def __init__(self):
+            self.calls = 0
+
+        async def get_config(self) -> Dict:
+            self.calls += 1
+            await asyncio.sleep(0)
+            return {"language": "en"}
+
+        async def get_stories(
+            self,
+            interpreter: Optional[NaturalLanguageInterpreter] = None,
+            template_variables: Optional[Dict] = None,
+            use_e2e: bool = False,
+            exclusion_percentage: Optional[int] = None,
+        ) -> StoryGraph:
+            self.calls += 1
+            await asyncio.sleep(0)
+            return StoryGraph([])
+
+    importer = CountingImporter()
+    combined = CombinedDataImporter([importer])
+
+    configs = await asyncio.gather(combined.get_config(), combined.get_config())
+    assert configs == [{"language": "en"}, {"language": "en"}]
+    assert await combined.get_config() == {"language": "en"}
+    assert importer.calls == 1
+
+    await asyncio.gather(
+        combined.get_stories(),
+        combined.get_stories(exclusion_percentage=None),
+        combined.get_stories(use_e2e=False),
+        combined.get_stories(None, None, False, None),
+    )
+    assert importer.calls == 2
+
+    await combined.get_stories(exclusion_percentage=10)
+    assert importer.calls == 3
+
+    # stories parsed with an explicit interpreter are not cached
+    await combined.get_stories(interpreter=RegexInterpreter())
+    await combined.get_stories(interpreter=RegexInterpreter())
+    assert importer.calls == 5
+
+    # arguments which can't be used as cache key bypass the cache
+    await combined.get_stories(template_variables={"name": "Rasa"})
+    await combined.get_stories(template_variables={"name": "Rasa"})
+    assert importer.calls == 7
+
+
 @pytest.mark.parametrize(
     "config, expected",
     [
@@ -89,6 +161,7 @@ def test_load_from_dict(
     config_path = os.path.join(project, DEFAULT_CONFIG_PATH)
     domain_path = os.path.join(project, DEFAULT_DOMAIN_PATH)
     default_data_path = os.path.join(project, DEFAULT_DATA_PATH)
+    original_config = copy.deepcopy(config)
     actual = TrainingDataImporter.load_from_dict(
         config, config_path, domain_path, [default_data_path]
     )
@@ -97,6 +170,7 @@ def test_load_from_dict(
 
     actual_importers = [i.__class__ for i in actual._importers]
     assert actual_importers == expected
+    assert config == original_config
 
 
 def test_load_from_config(tmpdir: Path):
@@ -1,3 +1,5 @@
+import copy
+import pickle
 from typing import List, Text
 
 import pytest
@@ -21,6 +23,15 @@ def test_tokens_comparison():
         assert y < "a"
 
 
+def test_tokens_copy_and_pickle():
+    token = Token("hello", 3, data={"pos": "INTJ"}, lemma="hi")
+
+    for restored in [copy.deepcopy(token), pickle.loads(pickle.dumps(token))]:
+        assert restored == token
+        assert restored.end == 8
+        assert restored.get("pos") == "INTJ"
+
+
 @pytest.mark.parametrize(
     "text, expected_tokens, expected_indices",
     [("Forecast for lunch", ["Forecast", "for", "lunch"], [(0, 8), (9, 12), (13, 18)])],
@@ -40,9 +51,10 @@ def test_train_tokenizer(text, expected_tokens, expected_indices):
     for attribute in [RESPONSE, TEXT]:
         tokens = training_data.training_examples[0].get(TOKENS_NAMES[attribute])
 
-        assert [t.text for t in tokens] == expected_tokens
-        assert [t.start for t in tokens] == [i[0] for i in expected_indices]
-        assert [t.end for t in tokens] == [i[1] for i in expected_indices]
+        assert [(t.text, t.start, t.end) for t in tokens] == [
+            (token, start, end)
+            for token, (start, end) in zip(expected_tokens, expected_indices)
+        ]
 
     # check intent attribute
     tokens = training_data.training_examples[0].get(TOKENS_NAMES[INTENT])
@@ -63,9 +75,10 @@ def test_process_tokenizer(text, expected_tokens, expected_indices):
 
     tokens = message.get(TOKENS_NAMES[TEXT])
 
-    assert [t.text for t in tokens] == expected_tokens
-    assert [t.start for t in tokens] == [i[0] for i in expected_indices]
-    assert [t.end for t in tokens] == [i[1] for i in expected_indices]
+    assert [(t.text, t.start, t.end) for t in tokens] == [
+        (token, start, end)
+        for token, (start, end) in zip(expected_tokens, expected_indices)
+    ]
 
 
 @pytest.mark.parametrize(
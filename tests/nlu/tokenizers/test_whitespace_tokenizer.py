@@ -76,9 +76,10 @@ def test_whitespace(text, expected_tokens, expected_indices):
 
     tokens = tk.tokenize(Message(text), attribute=TEXT)
 
-    assert [t.text for t in tokens] == expected_tokens
-    assert [t.start for t in tokens] == [i[0] for i in expected_indices]
-    assert [t.end for t in tokens] == [i[1] for i in expected_indices]
+    assert [(t.text, t.start, t.end) for t in tokens] == [
+        (token, start, end)
+        for token, (start, end) in zip(expected_tokens, expected_indices)
+    ]
 
 
 @pytest.mark.parametrize(
@@ -1,9 +1,11 @@
+import asyncio
 import logging
 from typing import Collection, List, Text
 
 import pytest
 
 from rasa.utils.common import (
+    lazy_async_method,
     raise_warning,
     sort_list_of_dicts_by_first_key,
     transform_collection_to_sentence,
@@ -93,3 +95,28 @@ def test_repeated_log_filter():
     assert log_filter.filter(record2_other_args) is True
     assert log_filter.filter(record3_other) is True
     assert log_filter.filter(record1) is True  # same as before, but not repeated
+
+
+async def test_lazy_async_method_survives_cancelled_caller():
+    class Loader:
+        def __init__(self):
+            self.calls = 0
+
+        @lazy_async_method
+        async def load(self) -> int:
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+    loader = Loader()
+    first = asyncio.ensure_future(loader.load())
+    second = asyncio.ensure_future(loader.load())
+    await asyncio.sleep(0)
+
+    first.cancel()
+
+    assert await second == 42
+    assert first.cancelled()
+    # the cancelled caller did not evict the shared result
+    assert await loader.load() == 42
+    assert loader.calls == 1